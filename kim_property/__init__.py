@@ -393,7 +393,11 @@ from .instance import \
     check_instance_optional_key_map, \
     check_instance_optional_key_marked_required_are_present, \
     check_property_instances
-from .create import get_properties, kim_property_create, unset_property_id
+from .create import \
+    get_properties, \
+    kim_property_create, \
+    kim_property_create_list, \
+    unset_property_id
 from .destroy import kim_property_destroy
 from .modify import kim_property_modify
 from .remove import kim_property_remove
@@ -424,6 +428,7 @@ __all__ = [
     "check_property_instances",
     "get_properties",
     "kim_property_create",
+    "kim_property_create_list",
     "unset_property_id",
     "kim_property_destroy",
     "kim_property_modify",
@@ -0,0 +1,87 @@
+"""KIM-EDN serialization.
+
+A shim over ``kim_edn`` with fast paths for the property instances which
+only carry the required "property-id" and "instance-id" keys.
+"""
+
+import json
+import re
+
+import kim_edn
+
+__all__ = [
+    "load",
+    "loads",
+    "dumps",
+]
+
+load = kim_edn.load
+
+_INSTANCE = r'\{{"property-id" "{0}[^"\\]*)" "instance-id" {0}[1-9][0-9]*)\}}'
+"""str: A property instance with only the required keys."""
+
+INSTANCE = re.compile(_INSTANCE.format('('))
+INSTANCES = re.compile(r'^\[(?:{0}(?: {0})*)?\]$'.format(_INSTANCE.format('(?:')))
+
+INSTANCE_TEMPLATES = {}
+"""dict: KIM-EDN templates of the property instances with only the required
+keys indexed by property full IDs."""
+
+
+def loads(s, _m=INSTANCES.match, _f=INSTANCE.findall):
+    """Deserialize the KIM-EDN formatted property instances.
+
+    Property instances with only the "property-id" and "instance-id" keys
+    are parsed directly, otherwise it falls back to ``kim_edn.loads``.
+
+    Arguments:
+        s {string or bytes} -- A string containing the serialized KIM-EDN
+            formatted property instances.
+
+    Returns:
+        list -- KIM property instances.
+
+    """
+    if not isinstance(s, str) or _m(s) is None:
+        return kim_edn.loads(s)
+    return [{"property-id": _id, "instance-id": int(_instance_id)}
+            for _id, _instance_id in _f(s)]
+
+
+def dumps(obj, _templates=INSTANCE_TEMPLATES):
+    """Serialize the KIM property instances to a KIM-EDN formatted string.
+
+    Property instances with only the "property-id" and "instance-id" keys
+    are serialized from a per property ID template, which gives the same
+    output as ``kim_edn.dumps``, otherwise it falls back to
+    ``kim_edn.dumps``.
+
+    Arguments:
+        obj {list} -- KIM property instances.
+
+    Returns:
+        string -- serialized KIM-EDN formatted property instances.
+
+    """
+    instances = []
+    for a_property_instance in obj:
+        if len(a_property_instance) != 2 or \
+                next(iter(a_property_instance)) != "property-id":
+            return kim_edn.dumps(obj)
+
+        _property_id = a_property_instance["property-id"]
+        _instance_id = a_property_instance.get("instance-id")
+        if not isinstance(_property_id, str) or \
+                type(_instance_id) is not int:
+            return kim_edn.dumps(obj)
+
+        template = _templates.get(_property_id)
+        if template is None:
+            template = '{"property-id" ' + \
+                json.dumps(_property_id).replace('%', '%%') + \
+                ' "instance-id" %d}'
+            _templates[_property_id] = template
+
+        instances.append(template % _instance_id)
+
+    return '[' + ' '.join(instances) + ']'
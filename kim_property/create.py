@@ -1,47 +1,195 @@
 """Create module."""
 
-from os.path import isfile
-
-import kim_edn
+from functools import lru_cache
+from os import stat
+from os.path import isfile, realpath
+import threading
 
+from ._edn import loads, dumps, load
 from .err import KIMPropertyError
 from .definition import check_property_definition
 from .instance import get_property_id_path, check_instance_id_format
-from .pickle import unpickle_kim_properties
+from .pickle import load_kim_properties, unpickle_kim_properties
 
 __all__ = [
     "get_properties",
     "kim_property_create",
+    "kim_property_create_list",
     "unset_property_id",
 ]
 
-KIM_PROPERTIES = None
-"""dict: KIM properties dictionary indexed by properties full IDs."""
+_TABLES = None
+"""tuple: The standard KIM properties, loaded on first use.
+
+- KIM_PROPERTIES, KIM properties dictionary indexed by properties full IDs.
+- PROPERTY_NAME_TO_PROPERTY_ID, KIM properties name to full ID dictionary.
+- PROPERTY_ID_TO_PROPERTY_NAME, KIM properties full ID to name dictionary.
+"""
+
+_TABLE_INDEX = {
+    "KIM_PROPERTIES": 0,
+    "PROPERTY_NAME_TO_PROPERTY_ID": 1,
+    "PROPERTY_ID_TO_PROPERTY_NAME": 2,
+}
+"""dict: Index of the standard KIM properties tables by their names."""
+
+_LOAD_LOCK = threading.Lock()
+"""threading.Lock: Lock to load the standard KIM properties once."""
+
+NEW_PROPERTY_IDS = set()
+"""set: Newly added property IDs, only updated in place."""
+
+
+def _ensure_loaded():
+    """Load the standard KIM properties on first use.
+
+    Returns:
+        tuple -- KIM_PROPERTIES, PROPERTY_NAME_TO_PROPERTY_ID, and
+            PROPERTY_ID_TO_PROPERTY_NAME.
+
+    """
+    global _TABLES
+
+    if _TABLES is not None:
+        return _TABLES
+
+    with _LOAD_LOCK:
+        if _TABLES is None:
+            # Get the standard KIM properties
+            try:
+                _TABLES = tuple(load_kim_properties())
+            except KIMPropertyError:
+                # Fall back to the pickled KIM properties
+                _TABLES = tuple(unpickle_kim_properties())
+
+    return _TABLES
+
+
+def __getattr__(name):
+    """Load the standard KIM properties on first attribute access."""
+    if name in _TABLE_INDEX:
+        return _ensure_loaded()[_TABLE_INDEX[name]]
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+@lru_cache(maxsize=128)
+def _load_and_check(path, mtime_ns, size, ino):
+    """Load and check the property definition from a file.
+
+    The result is cached by the file real path and its modification time,
+    size and inode number, so repeated creations from the same file skip
+    parsing, validation, and getting the property name from the property ID.
+
+    Arguments:
+        path {string} -- The canonical pathname of the property definition
+            file.
+        mtime_ns {int} -- The file modification time in nanoseconds.
+        size {int} -- The file size in bytes.
+        ino {int} -- The file inode number.
+
+    Returns:
+        dict, string, string -- The property definition, its property ID,
+            and property name.
+
+    """
+    # Load the property definition from a file
+    pd = load(path)
+
+    # Check the correctness of the property definition
+    check_property_definition(pd)
+
+    # Get the property ID
+    _property_id = pd["property-id"]
 
-PROPERTY_NAME_TO_PROPERTY_ID = None
-"""dict: KIM properties name to full ID dictionary."""
+    # Get the property name
+    _, _, _, _property_name = get_property_id_path(_property_id)
 
-PROPERTY_ID_TO_PROPERTY_NAME = None
-"""dict: KIM properties full ID to name dictionary."""
+    return pd, _property_id, _property_name
+
+
+def _get_property_id(property_name):
+    """Get the property ID of a KIM property or a property definition file.
+
+    A property definition file is loaded and added to the KIM properties.
+    The error message is returned rather than raised, so that the error is
+    reported from the public function called by the user.
+
+    Arguments:
+        property_name {string} --
+            - A string containing the property name or
+            - unique ID of the property, or
+            - a path-like object giving the pathname (absolute or relative to
+              the current working directory) of the file to be opened
+
+    Returns:
+        string, string -- The property ID and None, or None and the error
+            message.
+
+    """
+    kim_properties, property_name_to_property_id, \
+        property_id_to_property_name = _ensure_loaded()
+
+    # Check the in-memory KIM properties first to avoid a stat call
+    if property_name in property_name_to_property_id:
+        return property_name_to_property_id[property_name], None
+
+    if property_name in property_id_to_property_name:
+        return property_name, None
+
+    # If the property_name is a path-like object to a file to be opened
+    if isfile(property_name):
+        # Load and check the property definition from a file
+        path = realpath(property_name)
+        st = stat(path)
+        pd, _property_id, _property_name = _load_and_check(
+            path, st.st_mtime_ns, st.st_size, st.st_ino)
+
+        # Check to make sure that this property does not exist in OpenKIM
+        if _property_id in kim_properties:
+            msg = ('the input property_name file contains a property ID:\n'
+                   '"{}"\nwhich already '
+                   'exists in the KIM Property Definition list.\n'
+                   'Use the KIM Property Definition or update the ID in the '
+                   'property_name file.\n'
+                   'See the KIM Property Definitions at '
+                   'https://openkim.org/properties for more detailed '
+                   'information.').format(_property_id)
+            return None, msg
+
+        # Add the new property definition to KIM_PROPERTIES
+        kim_properties[_property_id] = pd
+
+        property_name_to_property_id[_property_name] = _property_id
+        property_id_to_property_name[_property_id] = _property_name
+
+        # Keep the record of a newly added properties
+        NEW_PROPERTY_IDS.add(_property_id)
 
-# Get the standard KIM properties
-KIM_PROPERTIES, PROPERTY_NAME_TO_PROPERTY_ID, \
-    PROPERTY_ID_TO_PROPERTY_NAME = unpickle_kim_properties()
+        return _property_id, None
 
-NEW_PROPERTY_IDS = None
-"""list: Newly added property IDs """
+    msg = ('the requested "property_name" :\n'
+           '"{}"\n'
+           'is not a valid KIM property name nor '
+           'a path-like object to a file.\n'
+           'See the KIM Property Definitions at '
+           'https://openkim.org/properties for more detailed '
+           'information.').format(property_name)
+    return None, msg
 
 
 def get_properties():
-    """Get the kim properties object hierarchy from the pickled object.
+    """Get the kim properties object hierarchy.
+
+    The standard KIM properties are loaded on first use.
 
     Returns:
         dict -- KIM_PROPERTIES.
     """
-    return KIM_PROPERTIES
+    return _ensure_loaded()[0]
 
 
-def unset_property_id(property_id):
+def unset_property_id(property_id, _new_property_ids=NEW_PROPERTY_IDS):
     """Unset a property with a "property_id" from kim properties.
 
     If a requested property with a "property_id" is a newly created
@@ -53,19 +201,15 @@ def unset_property_id(property_id):
             unique ID of the property.
 
     """
-    global NEW_PROPERTY_IDS
-    global PROPERTY_NAME_TO_PROPERTY_ID
-    global PROPERTY_ID_TO_PROPERTY_NAME
+    if property_id in _new_property_ids:
+        kim_properties, property_name_to_property_id, \
+            property_id_to_property_name = _ensure_loaded()
 
-    if NEW_PROPERTY_IDS is not None:
-        if property_id in NEW_PROPERTY_IDS:
-            del KIM_PROPERTIES[property_id]
-            _name = PROPERTY_ID_TO_PROPERTY_NAME[property_id]
-            del PROPERTY_NAME_TO_PROPERTY_ID[_name]
-            del PROPERTY_ID_TO_PROPERTY_NAME[property_id]
-            NEW_PROPERTY_IDS.remove(property_id)
-            if len(NEW_PROPERTY_IDS) == 0:
-                NEW_PROPERTY_IDS = None
+        del kim_properties[property_id]
+        _name = property_id_to_property_name[property_id]
+        del property_name_to_property_id[_name]
+        del property_id_to_property_name[property_id]
+        _new_property_ids.remove(property_id)
 
 
 def kim_property_create(instance_id, property_name, property_instances=None):
@@ -110,24 +254,27 @@ def kim_property_create(instance_id, property_name, property_instances=None):
             - unique ID of the property, or
             - a path-like object giving the pathname (absolute or relative to
               the current working directory) of the file to be opened
-        property_instances {string} -- A string containing the serialized
-            KIM-EDN formatted property instances. (default: {None})
+        property_instances {string or list} -- A string containing the
+            serialized KIM-EDN formatted property instances, or a list of
+            already deserialized KIM property instances, which is left
+            untouched. (default: {None})
 
     Returns:
         string -- serialized KIM-EDN formatted property instances.
 
-    """
-    global KIM_PROPERTIES
-    global PROPERTY_NAME_TO_PROPERTY_ID
-    global PROPERTY_ID_TO_PROPERTY_NAME
-    global NEW_PROPERTY_IDS
+    Chained calls (de)serialize or copy all the property instances on every
+    call. To create many property instances, use ``kim_property_create_list``
+    and serialize the result once at the end.
 
-    if not isinstance(instance_id, int):
-        msg = 'the "instance_id" is not an `int`.'
-        raise KIMPropertyError(msg)
+    """
+    # A positive int is a valid instance id, otherwise check the instance
+    # id format to prevent mistakes as early as possible
+    if type(instance_id) is not int or instance_id < 1:
+        if not isinstance(instance_id, int):
+            msg = 'the "instance_id" is not an `int`.'
+            raise KIMPropertyError(msg)
 
-    # Check instance id format to prevent mistakes as early as possible
-    check_instance_id_format(instance_id)
+        check_instance_id_format(instance_id)
 
     if not isinstance(property_name, str):
         msg = 'the "property_name" is not an `str`.'
@@ -136,91 +283,138 @@ def kim_property_create(instance_id, property_name, property_instances=None):
     if property_instances is None:
         kim_property_instances = []
     else:
-        # Deserialize the KIM property instances.
-        kim_property_instances = kim_edn.loads(property_instances)
+        if isinstance(property_instances, (list, tuple)):
+            # Copy, so the input property instances are left untouched
+            kim_property_instances = list(property_instances)
+        else:
+            # Deserialize the KIM property instances.
+            kim_property_instances = loads(property_instances)
 
         for a_property_instance in kim_property_instances:
             if instance_id == a_property_instance["instance-id"]:
-                msg = 'the "instance-id"’s cannot repeat. '
-                msg += 'In the case where there are multiple property '
-                msg += 'instances, the instance-id’s cannot repeat.'
+                msg = ('the "instance-id"’s cannot repeat. '
+                       'In the case where there are multiple property '
+                       'instances, the instance-id’s cannot repeat.')
                 raise KIMPropertyError(msg)
 
-    # KIM property names.
-    kim_property_names = list(PROPERTY_NAME_TO_PROPERTY_ID.keys())
+    property_id, msg = _get_property_id(property_name)
+    if msg is not None:
+        raise KIMPropertyError(msg)
 
-    # KIM property full IDs.
-    kim_property_ids = list(PROPERTY_ID_TO_PROPERTY_NAME.keys())
+    # Add the newly created property instance to the collection
+    kim_property_instances.append(
+        {"property-id": property_id, "instance-id": instance_id})
 
-    new_property_instance = {}
+    # If there are multiple keys sort them based on instance-id
+    if len(kim_property_instances) > 1:
+        kim_property_instances.sort(key=lambda i: i["instance-id"])
 
-    # If the property_name is a path-like object to a file to be opened
-    if isfile(property_name):
-        # Load the property definition from a file
-        pd = kim_edn.load(property_name)
+    # Return the serialize KIM property instances
+    return dumps(kim_property_instances)
 
-        # Check the correctness of th eproperty definition
-        check_property_definition(pd)
 
-        # Get the property ID
-        _property_id = pd["property-id"]
+def kim_property_create_list(instance_id, property_name,
+                             property_instances=None, instance_ids=None):
+    """Create a new kim property instance in a list of property instances.
 
-        # Check to make sure that this property does not exist in OpenKIM
-        if _property_id in KIM_PROPERTIES:
-            msg = 'the input property_name file contains a property ID:\n'
-            msg += '"{}"\nwhich already '.format(_property_id)
-            msg += 'exists in the KIM Property Definition list.\n'
-            msg += 'Use the KIM Property Definition or update the ID in the'
-            msg += 'property_name file.\n'
-            msg += 'See the KIM Property Definitions at '
-            msg += 'https://openkim.org/properties for more detailed '
-            msg += 'information.'
-            raise KIMPropertyError(msg)
+    It works the same as ``kim_property_create``, but on the deserialized
+    property instances. The newly created property instance is added to the
+    "property_instances" list in place. When creating many property
+    instances, passing the returned list to the next call and serializing it
+    once at the end avoids (de)serializing all the property instances on
+    every call.
 
-        # Add the new property definition to KIM_PROPERTIES
-        KIM_PROPERTIES[_property_id] = pd
+    The "property_instances" list must already be sorted based on
+    instance-id, as the lists returned by this function are. It is not
+    re-sorted, the new property instance is only inserted in order.
 
-        # Get the property name
-        _, _, _, _property_name = get_property_id_path(_property_id)
+    For example::
 
-        PROPERTY_NAME_TO_PROPERTY_ID[_property_name] = _property_id
-        PROPERTY_ID_TO_PROPERTY_NAME[_property_id] = _property_name
+    >>> obj = kim_property_create_list(1, 'cohesive-energy-relation-cubic-crystal')
+    >>> obj = kim_property_create_list(2, 'atomic-mass', obj)
+    >>> kim_edn.dumps(obj)
+    '[{"property-id" "tag:staff@noreply.openkim.org,2014-04-15:property/cohesive-energy-relation-cubic-crystal" "instance-id" 1} {"property-id" "tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass" "instance-id" 2}]'
 
-        kim_property_names.append(_property_name)
-        kim_property_ids.append(_property_id)
+    Keeping a set of the used instance ids alongside the list makes the
+    check for a repeated instance id O(1) instead of a scan of the list::
 
-        # Keep the record of a newly added properties
-        if NEW_PROPERTY_IDS is None:
-            NEW_PROPERTY_IDS = []
-        NEW_PROPERTY_IDS.append(_property_id)
+    >>> ids = set()
+    >>> obj = kim_property_create_list(1, 'cohesive-energy-relation-cubic-crystal', instance_ids=ids)
+    >>> obj = kim_property_create_list(2, 'atomic-mass', obj, ids)
+    >>> ids
+    {1, 2}
 
-        # Set the new instance property ID
-        new_property_instance["property-id"] = _property_id
-    else:
-        if property_name in kim_property_names:
-            new_property_instance["property-id"] = \
-                PROPERTY_NAME_TO_PROPERTY_ID[property_name]
-        elif property_name in kim_property_ids:
-            new_property_instance["property-id"] = property_name
-        else:
-            msg = 'the requested "property_name" :\n'
-            msg += '"{}"\n'.format(property_name)
-            msg += 'is not a valid KIM property name nor '
-            msg += 'a path-like object to a file.\n'
-            msg += 'See the KIM Property Definitions at '
-            msg += 'https://openkim.org/properties for more detailed '
-            msg += 'information.'
+    Arguments:
+        instance_id {int} -- A positive integer identifying the property
+            instance.
+        property_name {string} --
+            - A string containing the property name or
+            - unique ID of the property, or
+            - a path-like object giving the pathname (absolute or relative to
+              the current working directory) of the file to be opened
+        property_instances {list} -- A list of KIM property instances
+            sorted based on instance-id. (default: {None})
+        instance_ids {set} -- A set of the instance ids used in the
+            "property_instances", which is updated with the new instance id.
+            If it is None, the "property_instances" are searched instead.
+            (default: {None})
+
+    Returns:
+        list -- KIM property instances.
+
+    """
+    # A positive int is a valid instance id, otherwise check the instance
+    # id format to prevent mistakes as early as possible
+    if type(instance_id) is not int or instance_id < 1:
+        if not isinstance(instance_id, int):
+            msg = 'the "instance_id" is not an `int`.'
             raise KIMPropertyError(msg)
 
-    new_property_instance["instance-id"] = instance_id
+        check_instance_id_format(instance_id)
 
-    # Add the newly created property instance to the collection
-    kim_property_instances.append(new_property_instance)
+    if not isinstance(property_name, str):
+        msg = 'the "property_name" is not an `str`.'
+        raise KIMPropertyError(msg)
 
-    # If there are multiple keys sort them based on instance-id
-    if len(kim_property_instances) > 1:
-        kim_property_instances = sorted(
-            kim_property_instances, key=lambda i: i["instance-id"])
+    if property_instances is None:
+        kim_property_instances = []
+    else:
+        kim_property_instances = property_instances
 
-    # Return the serialize KIM property instances
-    return kim_edn.dumps(kim_property_instances)
+    if instance_ids is None:
+        repeated = any(instance_id == a_property_instance["instance-id"]
+                       for a_property_instance in kim_property_instances)
+    else:
+        repeated = instance_id in instance_ids
+
+    if repeated:
+        msg = ('the "instance-id"’s cannot repeat. '
+               'In the case where there are multiple property '
+               'instances, the instance-id’s cannot repeat.')
+        raise KIMPropertyError(msg)
+
+    property_id, msg = _get_property_id(property_name)
+    if msg is not None:
+        raise KIMPropertyError(msg)
+
+    new_property_instance = {"property-id": property_id,
+                             "instance-id": instance_id}
+
+    # Add the newly created property instance to the collection, keeping
+    # the already sorted collection sorted based on instance-id
+    if not kim_property_instances or \
+            kim_property_instances[-1]["instance-id"] < instance_id:
+        # Usual case of the increasing instance-id
+        kim_property_instances.append(new_property_instance)
+    else:
+        # Find the insertion point starting from the tail
+        i = len(kim_property_instances) - 1
+        while i > 0 and \
+                kim_property_instances[i - 1]["instance-id"] > instance_id:
+            i -= 1
+        kim_property_instances.insert(i, new_property_instance)
+
+    if instance_ids is not None:
+        instance_ids.add(instance_id)
+
+    return kim_property_instances
@@ -1,7 +1,6 @@
 """Destroy module."""
 
-import kim_edn
-
+from ._edn import loads, dumps
 from .err import KIMPropertyError
 from .create import unset_property_id
 
@@ -46,13 +45,19 @@ def kim_property_destroy(property_instances, instance_id):
         return '[]'
 
     # Deserialize the KIM property instances.
-    kim_property_instances = kim_edn.loads(property_instances)
+    kim_property_instances = loads(property_instances)
 
+    # Keep the property instances which do not match the instance id
+    survivors = []
+    removed_ids = []
     for a_property_instance in kim_property_instances:
         if instance_id == a_property_instance["instance-id"]:
-            property_id = a_property_instance["property-id"]
-            unset_property_id(property_id)
-            kim_property_instances.remove(a_property_instance)
+            removed_ids.append(a_property_instance["property-id"])
+        else:
+            survivors.append(a_property_instance)
+
+    for property_id in removed_ids:
+        unset_property_id(property_id)
 
     # Return the serialize KIM property instances
-    return kim_edn.dumps(kim_property_instances)
+    return dumps(survivors)
@@ -2,7 +2,9 @@
 
 from os.path import abspath, join, isdir, pardir, isfile, dirname
 from io import BytesIO
+import json
 import pickle
+import pickletools
 
 import kim_edn
 
@@ -12,6 +14,8 @@ from .instance import get_property_id_path
 __all__ = [
     "pickle_kim_properties",
     "unpickle_kim_properties",
+    "dump_kim_properties",
+    "load_kim_properties",
 ]
 
 
@@ -19,23 +23,19 @@ kim_properties_path = join(dirname(abspath(__file__)), "properties")
 """str: Absolute path to the KIM properties folder."""
 
 
-def pickle_kim_properties(properties=None,
-                          fp=join(kim_properties_path,
-                                  'kim_properties.pickle'),
-                          protocol=0):
-    """Serialize KIM properties.
+def _get_kim_properties_list(properties=None):
+    """Get the KIM properties list to be serialized.
 
     Keyword Arguments:
         properties {dict} -- KIM properties dictionary indexed by properties
             full IDs. (default: {None})
-        fp {string, or a ``.write()``-supporting bytes-like object} -- fp is a
-            file name string to open it or a ``.write()``-supporting
-            bytes-like object.
-        protocol {int} -- protocol which can be used for pickling.
-            (default: {0})
+
+    Returns:
+        list -- "kim_properties", "property_name_to_property_id", and
+            "property_id_to_property_name" objects.
 
     """
-    # List of KIM properties to be pickled
+    # List of KIM properties to be serialized
     kim_properties_list = []
 
     if properties is None:
@@ -244,14 +244,40 @@ def pickle_kim_properties(properties=None,
             id_to_property_name,
         ]
 
+    return kim_properties_list
+
+
+def pickle_kim_properties(properties=None,
+                          fp=join(kim_properties_path,
+                                  'kim_properties.pickle'),
+                          protocol=4):
+    """Serialize KIM properties.
+
+    Keyword Arguments:
+        properties {dict} -- KIM properties dictionary indexed by properties
+            full IDs. (default: {None})
+        fp {string, or a ``.write()``-supporting bytes-like object} -- fp is a
+            file name string to open it or a ``.write()``-supporting
+            bytes-like object.
+        protocol {int} -- protocol which can be used for pickling.
+            Protocol 4 is the highest one supported by all the Python
+            versions this package supports. (default: {4})
+
+    """
+    kim_properties_list = _get_kim_properties_list(properties)
+
+    # Pickle the kim_properties, and remove the unused PUT opcodes to make
+    # it smaller and faster to unpickle
+    s = pickletools.optimize(
+        pickle.dumps(kim_properties_list, protocol=protocol))
+
     if isinstance(fp, str):
         # See if this is a file name
         with open(fp, 'wb') as f:
-            # Pickle the kim_properties
-            pickle.dump(kim_properties_list, f, protocol=protocol)
+            f.write(s)
     else:
         try:
-            pickle.dump(kim_properties_list, fp, protocol=protocol)
+            fp.write(s)
         except:
             msg = 'wrong input. ("fp" should refer to a bytes-like object.)'
             raise KIMPropertyError(msg)
@@ -293,3 +319,74 @@ def unpickle_kim_properties(fp=join(kim_properties_path,
     except:
         msg = 'wrong input. Neither can open nor load the input.'
         raise KIMPropertyError(msg)
+
+
+def dump_kim_properties(properties=None,
+                        fp=join(kim_properties_path,
+                                'kim_properties.json')):
+    """Serialize KIM properties to JSON.
+
+    Unlike pickle, loading the JSON representation can not execute
+    arbitrary code.
+
+    Keyword Arguments:
+        properties {dict} -- KIM properties dictionary indexed by properties
+            full IDs. (default: {None})
+        fp {string, or a ``.write()``-supporting bytes-like object} -- fp is a
+            file name string to open it or a ``.write()``-supporting
+            bytes-like object.
+
+    """
+    kim_properties_list = _get_kim_properties_list(properties)
+
+    s = json.dumps(kim_properties_list, ensure_ascii=False).encode('utf-8')
+
+    if isinstance(fp, str):
+        # See if this is a file name
+        with open(fp, 'wb') as f:
+            f.write(s)
+    else:
+        try:
+            fp.write(s)
+        except:
+            msg = 'wrong input. ("fp" should refer to a bytes-like object.)'
+            raise KIMPropertyError(msg)
+
+
+def load_kim_properties(fp=join(kim_properties_path,
+                                'kim_properties.json')):
+    """Deserialize KIM properties from JSON.
+
+    Read the JSON representation of the KIM properties from the "fp" file
+    and return the "kim_properties", "property_name_to_property_id", and
+    "property_id_to_property_name" objects.
+
+    Keyword Arguments:
+        fp {string or bytes} -- fp is a file name string to open a file or
+            a bytes-like object.
+
+    Returns:
+        Deserialized KIM properties
+
+    """
+    if isinstance(fp, str):
+        if isfile(fp):
+            # See if this is a file name
+            with open(fp, 'rb') as f:
+                try:
+                    return json.loads(f.read())
+                except:
+                    msg = 'wrong input. Can\'t load JSON from the file '
+                    msg += '"{}".'.format(fp)
+                    raise KIMPropertyError(msg)
+
+        msg = 'wrong input. Can\'t load JSON from unicode string.\n'
+        msg += 'If "fp" refers to a file name, make sure it exists in PATH '
+        msg += 'or provide the file name with its absolute PATH.'
+        raise KIMPropertyError(msg)
+
+    try:
+        return json.loads(fp)
+    except:
+        msg = 'wrong input. Neither can open nor load the input.'
+        raise KIMPropertyError(msg)
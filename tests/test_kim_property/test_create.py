@@ -1,4 +1,10 @@
 from os.path import join, isfile
+import os
+import subprocess
+import sys
+import tempfile
+
+import kim_edn
 
 from tests.test_kim_property import PyTest
 
@@ -50,6 +56,15 @@ class TestCreateModule:
         self.assertRaises(self.KIMPropertyError, self.kim_property.kim_property_create,
                           10, 'new-name')
 
+        # The error is reported from the called function
+        with self.assertRaises(self.KIMPropertyError) as cm:
+            self.kim_property.kim_property_create(10, 'new-name')
+        self.assertTrue('ERROR(@kim_property_create)' in str(cm.exception))
+
+        with self.assertRaises(self.KIMPropertyError) as cm:
+            self.kim_property.kim_property_create_list(10, 'new-name')
+        self.assertTrue('ERROR(@kim_property_create_list)' in str(cm.exception))
+
         str_obj2 = '[{"property-id" "tag:staff@noreply.openkim.org,2014-04-15:property/cohesive-energy-relation-cubic-crystal" "instance-id" 1} {"property-id" "tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass" "instance-id" 2}]'
 
         # Create the property instance with the property name to the already created instance
@@ -62,6 +77,97 @@ class TestCreateModule:
         self.assertRaises(self.KIMPropertyError, self.kim_property.kim_property_create,
                           1, 'atomic-mass', str1)
 
+        # The property instances are sorted based on instance-id
+        str_obj4 = '[{"property-id" "tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass" "instance-id" 1} {"property-id" "tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass" "instance-id" 2} {"property-id" "tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass" "instance-id" 3}]'
+
+        str6 = self.kim_property.kim_property_create(3, 'atomic-mass')
+        str6 = self.kim_property.kim_property_create(1, 'atomic-mass', str6)
+        str6 = self.kim_property.kim_property_create(2, 'atomic-mass', str6)
+
+        self.assertTrue(str6 == str_obj4)
+
+        # The unsorted input property instances are sorted
+        str_obj5 = '[{"property-id" "tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass" "instance-id" 5} {"property-id" "tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass" "instance-id" 2}]'
+
+        str7 = self.kim_property.kim_property_create(3, 'atomic-mass', str_obj5)
+
+        self.assertTrue([i["instance-id"] for i in kim_edn.loads(str7)] == [2, 3, 5])
+
+        str8 = self.kim_property.kim_property_create(6, 'atomic-mass', str_obj5)
+
+        self.assertTrue([i["instance-id"] for i in kim_edn.loads(str8)] == [2, 5, 6])
+
+        # Property instances with additional keys
+        str4 = self.kim_property.kim_property_modify(
+            str1, 1, "key", "short-name", "source-value", "1", "fcc")
+
+        str5 = self.kim_property.kim_property_create(2, 'atomic-mass', str4)
+
+        str_obj3 = '[{"property-id" "tag:staff@noreply.openkim.org,2014-04-15:property/cohesive-energy-relation-cubic-crystal" "instance-id" 1 "short-name" {"source-value" ["fcc"]}} {"property-id" "tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass" "instance-id" 2}]'
+
+        self.assertTrue(str5 == str_obj3)
+
+    def test_create_list(self):
+        """Test the create functionality on a list of property instances."""
+        str_obj = '[{"property-id" "tag:staff@noreply.openkim.org,2014-04-15:property/cohesive-energy-relation-cubic-crystal" "instance-id" 1} {"property-id" "tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass" "instance-id" 2}]'
+
+        obj1 = self.kim_property.kim_property_create_list(
+            1, 'cohesive-energy-relation-cubic-crystal')
+
+        self.assertTrue(isinstance(obj1, list))
+
+        # The property instance is added in place
+        obj2 = self.kim_property.kim_property_create_list(
+            2, 'atomic-mass', obj1)
+
+        self.assertTrue(obj2 is obj1)
+        self.assertTrue(kim_edn.dumps(obj2) == str_obj)
+
+        # It will fail if the property instance already exists
+        self.assertRaises(self.KIMPropertyError, self.kim_property.kim_property_create_list,
+                          1, 'atomic-mass', obj2)
+
+        self.assertTrue(len(obj2) == 2)
+
+        # Keep the used instance ids alongside the property instances
+        ids = set()
+        obj4 = self.kim_property.kim_property_create_list(
+            1, 'cohesive-energy-relation-cubic-crystal', instance_ids=ids)
+        obj4 = self.kim_property.kim_property_create_list(
+            2, 'atomic-mass', obj4, ids)
+
+        self.assertTrue(ids == {1, 2})
+        self.assertTrue(kim_edn.dumps(obj4) == str_obj)
+
+        self.assertRaises(self.KIMPropertyError, self.kim_property.kim_property_create_list,
+                          2, 'atomic-mass', obj4, ids)
+
+        self.assertTrue(ids == {1, 2})
+
+        # An out-of-order instance id is inserted in order
+        obj4 = self.kim_property.kim_property_create_list(
+            5, 'atomic-mass', obj4, ids)
+        obj4 = self.kim_property.kim_property_create_list(
+            3, 'atomic-mass', obj4, ids)
+        obj4 = self.kim_property.kim_property_create_list(
+            4, 'atomic-mass', obj4)
+
+        self.assertTrue([i["instance-id"] for i in obj4] == [1, 2, 3, 4, 5])
+        self.assertTrue(ids == {1, 2, 3, 5})
+
+        # Create with the deserialized property instances
+        obj3 = self.kim_property.kim_property_create_list(
+            1, 'cohesive-energy-relation-cubic-crystal')
+
+        self.assertTrue(isinstance(obj3, list))
+
+        str1 = self.kim_property.kim_property_create(2, 'atomic-mass', obj3)
+
+        self.assertTrue(str1 == str_obj)
+
+        # The input property instances are left untouched
+        self.assertTrue(len(obj3) == 1)
+
     def test_create_from_a_file(self):
         """Test the create functionality for a new file as input."""
         # Correct object
@@ -84,6 +190,82 @@ class TestCreateModule:
         self.assertRaises(self.KIMPropertyError, self.kim_property.kim_property_create,
                           1, join("tests", "fixtures", "atomic-mass.edn"))
 
+    def test_create_from_an_edited_file(self):
+        """Test the create functionality for a property file edited in between."""
+        with open(join("tests", "fixtures", "new-property.edn")) as f:
+            edn = f.read()
+
+        property_id = "tag:yafshar@noreply.openkim.org,2020-03-02:property/atomic-mass-test"
+        property_id_new = property_id + "-new"
+
+        with tempfile.TemporaryDirectory() as tmp:
+            edn_file = join(tmp, "p.edn")
+            with open(edn_file, "w") as f:
+                f.write(edn.replace(property_id, property_id + "-old"))
+
+            try:
+                str1 = self.kim_property.kim_property_create(1, edn_file)
+                self.assertTrue(property_id + "-old" in str1)
+
+                self.kim_property.kim_property_destroy(str1, 1)
+
+                # Rewrite the file with a new property ID
+                with open(edn_file, "w") as f:
+                    f.write(edn.replace(property_id, property_id_new))
+
+                str2 = self.kim_property.kim_property_create(1, edn_file)
+                self.assertTrue(property_id_new in str2)
+                self.assertTrue(property_id + "-old" not in str2)
+            finally:
+                self.kim_property.unset_property_id(property_id + "-old")
+                self.kim_property.unset_property_id(property_id_new)
+
+    def test_create_from_a_relative_path(self):
+        """Test the create functionality for the same relative path in different directories."""
+        with open(join("tests", "fixtures", "new-property.edn")) as f:
+            edn = f.read()
+
+        property_id = "tag:yafshar@noreply.openkim.org,2020-03-02:property/atomic-mass-test"
+        property_id_a = property_id + "-a"
+        property_id_b = property_id + "-b"
+
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            for d, _id in (("a", property_id_a), ("b", property_id_b)):
+                os.mkdir(join(tmp, d))
+                edn_file = join(tmp, d, "p.edn")
+                with open(edn_file, "w") as f:
+                    f.write(edn.replace(property_id, _id))
+                # Both files have the same modification time
+                os.utime(edn_file, ns=(0, 0))
+
+            try:
+                os.chdir(join(tmp, "a"))
+                str1 = self.kim_property.kim_property_create(1, "p.edn")
+                self.assertTrue(property_id_a in str1)
+
+                os.chdir(join(tmp, "b"))
+                str2 = self.kim_property.kim_property_create(1, "p.edn")
+                self.assertTrue(property_id_b in str2)
+            finally:
+                os.chdir(cwd)
+                self.kim_property.unset_property_id(property_id_a)
+                self.kim_property.unset_property_id(property_id_b)
+
+    def test_lazy_loading(self):
+        """Test the KIM properties tables are loaded on first use."""
+        # Run in a fresh interpreter, the tables are already loaded here
+        code = (
+            "import kim_property.create as c\n"
+            "assert c._TABLES is None\n"
+            "from kim_property.create import KIM_PROPERTIES\n"
+            "assert c._TABLES is not None\n"
+            "assert KIM_PROPERTIES is c.get_properties()\n"
+        )
+        root = os.path.dirname(os.path.dirname(
+            os.path.dirname(os.path.abspath(__file__))))
+        subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
 
 class TestPyTestCreateModule(TestCreateModule, PyTest):
     pass
@@ -26,11 +26,18 @@ class TestDestroyModule:
 
         self.assertTrue(str2 == str_obj)
 
+        # Destroy the adjacent property instances with the same instance id
+        str_obj3 = '[{"property-id" "tag:staff@noreply.openkim.org,2014-04-15:property/cohesive-energy-relation-cubic-crystal" "instance-id" 1} {"property-id" "tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass" "instance-id" 1}]'
+
+        str3 = self.kim_property.kim_property_destroy(str_obj3, 1)
+
+        self.assertTrue(str3 == '[]')
+
         # Test the empty string
-        for str_obj3 in ['', 'None', '[]']:
-            str3 = self.kim_property.kim_property_destroy(str_obj3, 1)
+        for str_obj4 in ['', 'None', '[]']:
+            str4 = self.kim_property.kim_property_destroy(str_obj4, 1)
 
-            self.assertTrue(str3 == '[]')
+            self.assertTrue(str4 == '[]')
 
     def test_destroy_new_from_a_file(self):
         """Test the destroy functionality for a new property created from a file as input."""
@@ -55,6 +62,17 @@ class TestDestroyModule:
         kim_properties = self.kim_property.get_properties()
         self.assertTrue(property_id not in kim_properties)
 
+        # Create the property instance from the same file again
+        str2 = self.kim_property.kim_property_create(
+            1, edn_file)
+
+        self.assertTrue(str2 == str_obj)
+
+        self.kim_property.kim_property_destroy(str2, 1)
+
+        kim_properties = self.kim_property.get_properties()
+        self.assertTrue(property_id not in kim_properties)
+
 
 class TestPyTestDestroyModule(TestDestroyModule, PyTest):
     pass
@@ -0,0 +1,43 @@
+import kim_edn
+
+from kim_property._edn import loads, dumps
+from tests.test_kim_property import PyTest
+
+
+EDN_PROPERTY_INSTANCES = [
+    '[]',
+    '[{"property-id" "tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass" "instance-id" 1}]',
+    '[{"property-id" "tag:staff@noreply.openkim.org,2014-04-15:property/cohesive-energy-relation-cubic-crystal" "instance-id" 1} {"property-id" "tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass" "instance-id" 20}]',
+    '[{"instance-id" 1 "property-id" "tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass"}]',
+    '[{"property-id" "tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass" "instance-id" 1 "mass" {"source-value" 26.98}}]',
+    '[{"property-id" "tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass"\n  "instance-id" 1}]',
+]
+
+
+class TestEdnModule:
+    """Test kim_property utility module KIM-EDN serialization."""
+
+    def test_loads(self):
+        """Test deserializing the property instances."""
+        for s in EDN_PROPERTY_INSTANCES:
+            self.assertTrue(loads(s) == kim_edn.loads(s))
+
+        # Bytes input
+        for s in EDN_PROPERTY_INSTANCES:
+            b = s.encode('utf-8')
+            self.assertTrue(loads(b) == kim_edn.loads(s))
+
+    def test_dumps(self):
+        """Test serializing the property instances."""
+        for s in EDN_PROPERTY_INSTANCES:
+            obj = kim_edn.loads(s)
+            self.assertTrue(dumps(obj) == kim_edn.dumps(obj))
+
+        # Fall back for the non-integer instance id
+        obj = [{"property-id": "tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass",
+                "instance-id": True}]
+        self.assertTrue(dumps(obj) == kim_edn.dumps(obj))
+
+
+class TestPyTestEdnModule(TestEdnModule, PyTest):
+    pass
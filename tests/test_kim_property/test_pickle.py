@@ -1,12 +1,15 @@
 from os.path import join, isfile
 from io import BytesIO, StringIO
 import pickle
+import tempfile
 
 import kim_edn
 
 from kim_property.pickle import \
     pickle_kim_properties, \
-    unpickle_kim_properties
+    unpickle_kim_properties, \
+    dump_kim_properties, \
+    load_kim_properties
 from tests.test_kim_property import PyTest
 
 
@@ -93,6 +96,63 @@ class TestPickle:
                           unpickle_kim_properties,
                           bio1.getvalue())
 
+    def test_dump_load_kim_properties(self):
+        """Test the JSON serialization of the KIM properties."""
+        # Fails when can't load JSON from unicode string
+        self.assertRaises(self.KIMPropertyError,
+                          load_kim_properties,
+                          'kim_properties.json')
+
+        # Property definition edn file
+        edn_file1 = join("tests", "fixtures", "atomic-mass.edn")
+        self.assertTrue(isfile(edn_file1))
+
+        edn_file2 = join("tests", "fixtures",
+                         "cohesive-energy-relation-cubic-crystal.edn")
+        self.assertTrue(isfile(edn_file2))
+
+        properties = {"tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass": kim_edn.load(edn_file1),
+                      "tag:staff@noreply.openkim.org,2014-04-15:property/cohesive-energy-relation-cubic-crystal": kim_edn.load(edn_file2)}
+
+        bio = BytesIO()
+        dump_kim_properties(properties, bio)
+
+        # Test the load utility
+        _properties, _name_to_id, _id_to_name = load_kim_properties(
+            bio.getvalue())
+
+        name_to_id = {"atomic-mass": "tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass",
+                      "cohesive-energy-relation-cubic-crystal": "tag:staff@noreply.openkim.org,2014-04-15:property/cohesive-energy-relation-cubic-crystal"}
+
+        id_to_name = {"tag:brunnels@noreply.openkim.org,2016-05-11:property/atomic-mass": "atomic-mass",
+                      "tag:staff@noreply.openkim.org,2014-04-15:property/cohesive-energy-relation-cubic-crystal": "cohesive-energy-relation-cubic-crystal"}
+
+        self.assertTrue(_properties == properties)
+        self.assertTrue(_name_to_id == name_to_id)
+        self.assertTrue(_id_to_name == id_to_name)
+
+        sio = StringIO()
+        self.assertRaises(self.KIMPropertyError, dump_kim_properties,
+                          properties, sio)
+
+        # Fails when neither can open nor load the input
+        self.assertRaises(self.KIMPropertyError,
+                          load_kim_properties,
+                          BytesIO().getvalue())
+
+        # Fails when the JSON file is corrupt
+        with tempfile.TemporaryDirectory() as tmp:
+            json_file = join(tmp, "kim_properties.json")
+            with open(json_file, "wb") as f:
+                f.write(bio.getvalue()[:-10])
+            self.assertRaises(self.KIMPropertyError,
+                              load_kim_properties,
+                              json_file)
+
+        # The bundled JSON and pickle KIM properties are the same
+        self.assertTrue(load_kim_properties() ==
+                        list(unpickle_kim_properties()))
+
 
 class TestPyTestPickle(TestPickle, PyTest):
     pass